@@ -6,16 +6,17 @@ Implements three gate types:
 - redteam: Security adversarial testing (100% threshold)
 """
 
-import importlib.util
+import hashlib
 import json
 import signal
 import time
+import types
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     """Result of running a single evaluation case."""
 
@@ -26,7 +27,7 @@ class EvalResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GateReport:
     """Report from running an evaluation gate."""
 
@@ -55,6 +56,26 @@ class EvalGate:
     def __init__(self, eval_dir: Path) -> None:
         """Initialize eval gate with the path to evaluation data directory."""
         self.eval_dir = eval_dir
+        # skill.py path -> (sha256 of source, compiled code)
+        self._code_cache: dict[Path, tuple[bytes, types.CodeType]] = {}
+
+    def _compile_skill(self, skill_file: Path) -> types.CodeType:
+        """Compile skill.py once and reuse the code object while its bytes are unchanged.
+
+        The cache is keyed on a content hash rather than mtime/size, which can
+        miss a same-size rewrite within one timestamp tick and serve stale code.
+        Each case still executes the code in a fresh module namespace, so no
+        state is shared between cases.
+        """
+        source = skill_file.read_bytes()
+        digest = hashlib.sha256(source).digest()
+        cached = self._code_cache.get(skill_file)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        code = compile(source, str(skill_file), "exec")
+        self._code_cache[skill_file] = (digest, code)
+        return code
 
     def load_cases(self, category: str, skill_name: str) -> list[dict]:
         """Load evaluation cases for a specific category and skill.
@@ -98,9 +119,12 @@ class EvalGate:
         start_time = time.time()
 
         try:
-            # Load skill module dynamically
+            # Load skill module dynamically (the compile-cache read doubles
+            # as the existence check)
             skill_file = skill_path / "skill.py"
-            if not skill_file.exists():
+            try:
+                code = self._compile_skill(skill_file)
+            except FileNotFoundError:
                 return EvalResult(
                     case_id=case_id,
                     passed=False,
@@ -108,17 +132,9 @@ class EvalGate:
                     duration_ms=(time.time() - start_time) * 1000,
                 )
 
-            spec = importlib.util.spec_from_file_location("skill", skill_file)
-            if spec is None or spec.loader is None:
-                return EvalResult(
-                    case_id=case_id,
-                    passed=False,
-                    error="Failed to create module spec",
-                    duration_ms=(time.time() - start_time) * 1000,
-                )
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = types.ModuleType("skill")
+            module.__file__ = str(skill_file)
+            exec(code, module.__dict__)
 
             # Get action function
             if not hasattr(module, "action"):
@@ -253,13 +269,15 @@ class EvalGate:
         """
         cases = self.load_cases(category, skill_name)
         results = []
+        passed_count = 0
 
+        # Count passes while running, instead of a second pass over results
         for case in cases:
             result = self.run_case(case, skill_path)
             results.append(result)
+            passed_count += result.passed
 
         total = len(results)
-        passed_count = sum(1 for r in results if r.passed)
         failed_count = total - passed_count
         pass_rate = passed_count / total if total > 0 else 1.0  # No cases = pass
 
@@ -23,9 +23,7 @@ from .llm.base import LLMProvider, SkillPackage
 from .models.queue import NightlyQueue
 from .models.registry import ValidationResult
 from .registry import Registry, compute_hash
-from .sandbox.runner import SandboxRunner
 from .security.ast_gate import ASTGate
-from .validators.manifest import validate_manifest
 
 
 def get_provider(provider_name: str) -> LLMProvider:
@@ -122,6 +120,10 @@ def evolve(
     Returns:
         Summary dict: {processed, succeeded, failed, skipped}
     """
+    # Deferred so `--help` and argument errors skip importing docker and jsonschema
+    from .sandbox.runner import SandboxRunner
+    from .validators.manifest import validate_manifest
+
     # Initialize components
     queue = load_queue(queue_path)
     registry = Registry(registry_path)
@@ -156,11 +156,9 @@ def promote_all(
         "skipped": [],
     }
 
-    for skill_name in registry.list_skills():
-        entry = registry.get_entry(skill_name)
-        if entry is None:
-            continue
-
+    # Parse the registry once; promoting one skill never changes another
+    # skill's staging pointer, so the snapshot stays valid for the loop
+    for skill_name, entry in registry.load().skills.items():
         # Skip if no staging version
         if entry.current_staging is None:
             result["skipped"].append(skill_name)
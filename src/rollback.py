@@ -5,6 +5,7 @@ from datetime import datetime
 from pathlib import Path
 
 from .audit import AuditLogger
+from .models.registry import SkillEntry
 from .registry import Registry
 
 
@@ -27,6 +28,30 @@ def rollback_skill(
     Returns:
         True on successful rollback.
 
+    Raises:
+        ValueError: If skill or version doesn't exist, or target version was never validated.
+    """
+    rollback_skill_entry(
+        skill_name, target_version, registry_path, audit_log_path, prod_path
+    )
+    return True
+
+
+def rollback_skill_entry(
+    skill_name: str,
+    target_version: str,
+    registry_path: Path,
+    audit_log_path: Path,
+    prod_path: Path | None = None,
+) -> SkillEntry:
+    """Rollback a skill and return its updated registry entry.
+
+    Same as rollback_skill(), but returns the in-memory entry that was saved
+    so callers can inspect the result without reloading the registry.
+
+    Returns:
+        The updated SkillEntry for the skill.
+
     Raises:
         ValueError: If skill or version doesn't exist, or target version was never validated.
     """
@@ -91,7 +116,7 @@ def rollback_skill(
         to=target_version,
     )
 
-    return True
+    return entry
 
 
 def main() -> None:
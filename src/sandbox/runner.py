@@ -7,42 +7,133 @@ Security flags per spec/security.md §4.1:
 - --memory 512m: Limit memory
 - --pids-limit 128: Limit processes
 - --security-opt no-new-privileges:true: Prevent privilege escalation
+
+With reuse_container=True a single long-lived container (same flags) is started
+lazily and each run is executed inside it via `docker exec`, skipping the
+per-run container create/teardown cost. Before every exec the container is
+reset: every process left by earlier runs is killed and /tmp is emptied, so
+nothing a previous skill left behind can observe or affect the next one.
 """
+import atexit
+import os
+import shutil
+import stat
+import tempfile
 import time
+import uuid
 from pathlib import Path
 from typing import Any
 
 import docker
 from docker.errors import APIError, ImageNotFound
+from requests.exceptions import ReadTimeout
+
+
+# coreutils `timeout` exits 124 when the limit is hit (also with --signal=KILL).
+# 137 (128 + SIGKILL) means the skill was killed by something else, e.g. the
+# OOM killer, and is reported as a plain failure.
+_TIMEOUT_EXIT_CODE = 124
+
+# docker-py's default HTTP read timeout; exec_start blocks for the whole run,
+# so the client timeout must outlast the sandbox timeout by this margin
+_DEFAULT_API_TIMEOUT = 60
+_API_TIMEOUT_MARGIN = 30
+
+# Execs run as this user, not the image's sandbox user that owns the keep-alive
+# `sleep`. Without CAP_KILL, kill -1 then reaches only processes started by
+# earlier execs, never init or the keep-alive process the container lives on.
+_EXEC_USER = "nobody"
+
+# Run before each exec in the shared container
+_RESET_SCRIPT = "kill -9 -1 2>/dev/null; rm -rf /tmp/* /tmp/.[!.]* /tmp/..?* 2>/dev/null; true"
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, falling back to a real copy (e.g. across filesystems).
+
+    Safe for exec runs: the work directory is mounted read-only in the
+    container and each run's copy is removed afterwards. Files the container
+    user could not read are copied and made world-readable instead, so the
+    source file's mode is never changed through a shared inode.
+    """
+    if os.stat(src).st_mode & stat.S_IROTH:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    os.chmod(dst, os.stat(dst).st_mode | 0o444)
+
+
+def _make_traversable(root: Path) -> None:
+    """chmod root and every directory below it to 0o755.
+
+    The image runs as a non-root user whose UID need not match the host's,
+    and mkdtemp()/copytree() can produce 0o700 directories it cannot enter.
+    """
+    root.chmod(0o755)
+    for path in root.rglob("*"):
+        if path.is_dir() and not path.is_symlink():
+            path.chmod(0o755)
 
 
 class SandboxRunner:
     """Docker-based sandbox runner for skill verification."""
 
-    def __init__(self, image: str = "openclaw-sandbox:latest", timeout: int = 30):
+    def __init__(
+        self,
+        image: str = "openclaw-sandbox:latest",
+        timeout: int = 30,
+        reuse_container: bool = False,
+    ):
         """Initialize sandbox runner.
 
         Args:
             image: Docker image name for sandbox
             timeout: Maximum execution time in seconds
+            reuse_container: Run skills via `docker exec` in one long-lived
+                container instead of a fresh container per run
+
+        Raises:
+            ValueError: If timeout is not a positive number of seconds.
         """
+        # Validate before touching any state (the Docker client is lazy anyway)
+        if timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+
         self.image = image
         self.timeout = timeout
+        self.reuse_container = reuse_container
         self._client: docker.DockerClient | None = None
+        self._available: bool | None = None
+        self._container: Any = None
+        self._workdir: Path | None = None
 
     @property
     def client(self) -> docker.DockerClient:
         """Lazy-load Docker client."""
         if self._client is None:
-            self._client = docker.from_env()
+            self._client = docker.from_env(
+                timeout=max(_DEFAULT_API_TIMEOUT, self.timeout + _API_TIMEOUT_MARGIN)
+            )
         return self._client
 
-    def is_available(self) -> bool:
+    def is_available(self, refresh: bool = False) -> bool:
         """Check if Docker daemon is available and image exists.
 
+        The result is cached on the instance; pass refresh=True to re-probe
+        (e.g. after building the image).
+
         Returns:
             True if Docker is ready to run sandboxes
         """
+        if self._available is None or refresh:
+            self._available = self._probe()
+        return self._available
+
+    def _probe(self) -> bool:
+        """Ping the Docker daemon and look up the sandbox image."""
         try:
             self.client.ping()
             self.client.images.get(self.image)
@@ -50,6 +141,138 @@ class SandboxRunner:
         except (APIError, ImageNotFound, Exception):
             return False
 
+    def _security_kwargs(self) -> dict[str, Any]:
+        """Container options enforcing the sandbox security flags."""
+        return {
+            # Security: Network isolation
+            "network_mode": "none",
+            # Security: Read-only filesystem
+            "read_only": True,
+            # Security: Resource limits
+            "mem_limit": "512m",
+            "memswap_limit": "512m",
+            "cpu_period": 100000,
+            "cpu_quota": 100000,  # 1 CPU
+            "pids_limit": 128,
+            # Security: Drop all capabilities
+            "cap_drop": ["ALL"],
+            # Security: Prevent privilege escalation
+            "security_opt": ["no-new-privileges:true"],
+            # Security: Limited /tmp
+            "tmpfs": {"/tmp": "size=64m,noexec"},
+        }
+
+    def _ensure_container(self) -> tuple[Any, Path]:
+        """Lazily start the long-lived container used when reuse_container=True.
+
+        Skills are copied into a host work directory that is bind-mounted
+        read-only at /skills, so the container filesystem stays read-only.
+
+        Returns:
+            Tuple of (container, host work directory)
+        """
+        if self._container is None or self._workdir is None:
+            workdir = Path(tempfile.mkdtemp(prefix="openclaw-sandbox-"))
+            try:
+                _make_traversable(workdir)
+                container = self.client.containers.run(
+                    self.image,
+                    command=["sleep", "infinity"],
+                    volumes={str(workdir): {"bind": "/skills", "mode": "ro"}},
+                    detach=True,
+                    # An init as PID 1 reaps processes killed by the per-run reset
+                    init=True,
+                    **self._security_kwargs(),
+                )
+            except BaseException:
+                shutil.rmtree(workdir, ignore_errors=True)
+                raise
+            self._container, self._workdir = container, workdir
+            atexit.register(self.close)
+        return self._container, self._workdir
+
+    def close(self) -> None:
+        """Remove the long-lived container and its work directory, if any."""
+        if self._container is not None:
+            try:
+                self._container.remove(force=True)
+            except Exception:
+                pass
+            self._container = None
+        if self._workdir is not None:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+            self._workdir = None
+
+    def _reset_container(self, container: Any) -> None:
+        """Kill leftover processes and clear /tmp in the shared container."""
+        api = self.client.api
+        exec_id = api.exec_create(
+            container.id, ["sh", "-c", _RESET_SCRIPT], user=_EXEC_USER
+        )["Id"]
+        api.exec_start(exec_id)
+
+    def _run_exec(self, skill_path: Path) -> tuple[bool, str, dict[str, Any]]:
+        """Run skill verification inside the long-lived container via exec."""
+        start_time = time.time()
+        metrics: dict[str, Any] = {}
+        run_dir: Path | None = None
+
+        try:
+            container, workdir = self._ensure_container()
+            run_id = uuid.uuid4().hex
+            run_dir = workdir / run_id
+            # symlinks=True keeps links as links: following them would copy
+            # (and make world-readable) host files outside the skill dir
+            shutil.copytree(skill_path, run_dir, symlinks=True, copy_function=_link_or_copy)
+            _make_traversable(run_dir)
+
+            api = self.client.api
+            self._reset_container(container)
+            exec_id = api.exec_create(
+                container.id,
+                [
+                    "timeout", "--signal=KILL", str(self.timeout),
+                    "python", "/sandbox/harness.py", f"/skills/{run_id}",
+                ],
+                user=_EXEC_USER,
+            )["Id"]
+            logs = api.exec_start(exec_id).decode("utf-8", errors="replace")
+            exit_code = api.exec_inspect(exec_id).get("ExitCode")
+            if exit_code is None:
+                exit_code = 1
+            if exit_code == _TIMEOUT_EXIT_CODE:
+                # Same metrics as a timed-out container wait in run()
+                exit_code = -1
+                metrics["timeout"] = True
+
+            metrics["exit_code"] = exit_code
+            metrics["duration_ms"] = int((time.time() - start_time) * 1000)
+
+            # CRITICAL: Both conditions must be true
+            passed = exit_code == 0 and "VERIFICATION_SUCCESS" in logs
+            return passed, logs, metrics
+
+        except ReadTimeout:
+            # Host-side backstop; whatever is still running is killed by the
+            # next run's reset or by close()
+            metrics["timeout"] = True
+            metrics["exit_code"] = -1
+            metrics["duration_ms"] = int((time.time() - start_time) * 1000)
+            return False, "Sandbox exec timed out", metrics
+
+        except ImageNotFound:
+            return False, f"Docker image not found: {self.image}", {"error": "image_not_found"}
+
+        except APIError as e:
+            return False, f"Docker API error: {e}", {"error": "api_error"}
+
+        except Exception as e:
+            return False, f"Runner error: {e}", {"error": str(e)}
+
+        finally:
+            if run_dir is not None:
+                shutil.rmtree(run_dir, ignore_errors=True)
+
     def run(
         self, skill_path: Path, output_path: Path | None = None
     ) -> tuple[bool, str, dict[str, Any]]:
@@ -65,6 +288,10 @@ class SandboxRunner:
             - logs: Container stdout/stderr
             - metrics: Dict with exit_code, duration_ms, etc.
         """
+        # The shared container has no /output mount, so fall back to a fresh run
+        if self.reuse_container and output_path is None:
+            return self._run_exec(skill_path)
+
         container = None
         logs = ""
         start_time = time.time()
@@ -83,24 +310,9 @@ class SandboxRunner:
                 self.image,
                 command=["python", "/sandbox/harness.py", "/skill"],
                 volumes=volumes,
-                # Security: Network isolation
-                network_mode="none",
-                # Security: Read-only filesystem
-                read_only=True,
-                # Security: Resource limits
-                mem_limit="512m",
-                memswap_limit="512m",
-                cpu_period=100000,
-                cpu_quota=100000,  # 1 CPU
-                pids_limit=128,
-                # Security: Drop all capabilities
-                cap_drop=["ALL"],
-                # Security: Prevent privilege escalation
-                security_opt=["no-new-privileges:true"],
-                # Security: Limited /tmp
-                tmpfs={"/tmp": "size=64m,noexec"},
                 # Run detached so we can wait with timeout
                 detach=True,
+                **self._security_kwargs(),
             )
 
             # Wait for completion with timeout
@@ -17,8 +17,11 @@ from .policy import (
     SUSPICIOUS_PATTERNS,
 )
 
+# Compiled once at import; every ASTGate instance shares them
+_SUSPICIOUS_REGEXES = tuple((pattern, re.compile(pattern)) for pattern in SUSPICIOUS_PATTERNS)
 
-@dataclass
+
+@dataclass(slots=True)
 class GateResult:
     """Result of AST Gate security check."""
 
@@ -39,17 +42,34 @@ class ASTGate:
         Returns:
             GateResult with passed status and list of violations
         """
-        violations: list[str] = []
-
-        # Phase 1: String pattern check
-        violations.extend(self._check_strings(code))
-
-        # Phase 2: AST parse
+        # Phase 2: AST parse (phases 1 and 3 run in check_tree)
         try:
             tree = ast.parse(code)
         except SyntaxError as e:
             return GateResult(passed=False, violations=[f"Syntax error: {e}"])
 
+        return self.check_tree(tree, code)
+
+    def check_tree(self, tree: ast.AST, code: str) -> GateResult:
+        """
+        Run phases 1 and 3 on an already-parsed tree.
+
+        Lets callers that already hold the AST skip a second ast.parse().
+        The source is still required because string patterns (phase 1) can
+        hide in comments and are not recoverable from the tree.
+
+        Args:
+            tree: AST parsed from code
+            code: The Python source the tree was parsed from
+
+        Returns:
+            GateResult with passed status and list of violations
+        """
+        violations: list[str] = []
+
+        # Phase 1: String pattern check
+        violations.extend(self._check_strings(code))
+
         # Phase 3: AST walk
         for node in ast.walk(tree):
             if isinstance(node, ast.Import):
@@ -66,8 +86,8 @@ class ASTGate:
     def _check_strings(self, code: str) -> list[str]:
         """Check for suspicious string patterns in code."""
         violations = []
-        for pattern in SUSPICIOUS_PATTERNS:
-            if re.search(pattern, code):
+        for pattern, regex in _SUSPICIOUS_REGEXES:
+            if regex.search(code):
                 violations.append(f"Suspicious pattern detected: {pattern}")
         return violations
 
@@ -1,5 +1,6 @@
 """Manifest validation against JSON Schema."""
 
+import functools
 import json
 from pathlib import Path
 
@@ -15,6 +16,19 @@ def _load_schema() -> dict:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> jsonschema.protocols.Validator:
+    """Build the schema validator once per process.
+
+    Load and schema errors are not cached, so a missing or broken schema
+    file is retried (and reported) on the next call.
+    """
+    schema = _load_schema()
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def validate_manifest(manifest: dict) -> tuple[bool, list[str]]:
     """
     Validate a manifest against the skill schema and MVP constraints.
@@ -28,12 +42,11 @@ def validate_manifest(manifest: dict) -> tuple[bool, list[str]]:
     """
     errors: list[str] = []
 
-    # Load and validate against JSON Schema
+    # Validate against JSON Schema (same error choice as jsonschema.validate)
     try:
-        schema = _load_schema()
-        jsonschema.validate(instance=manifest, schema=schema)
-    except jsonschema.ValidationError as e:
-        errors.append(f"Schema validation error: {e.message}")
+        error = jsonschema.exceptions.best_match(_get_validator().iter_errors(manifest))
+        if error is not None:
+            errors.append(f"Schema validation error: {error.message}")
     except FileNotFoundError:
         errors.append(f"Schema file not found: {SCHEMA_PATH}")
     except json.JSONDecodeError as e:
@@ -1,6 +1,7 @@
 """Pytest fixtures for OpenClaw tests."""
 
 import json
+import subprocess
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +10,122 @@ import pytest
 
 from src.sandbox.runner import SandboxRunner
 
+SANDBOX_IMAGE = "openclaw-sandbox:latest"
+REPO_ROOT = Path(__file__).parent.parent
+
+# Fixtures that need a live Docker daemon; tests using them get the docker marker
+_DOCKER_FIXTURES = frozenset({"sandbox_image", "docker_available"})
+
+# Constant fixture documents are serialized once at import, not per test
+_EMPTY_REGISTRY_JSON = json.dumps({"skills": {}, "updated_at": None}, indent=2)
+_EMPTY_QUEUE_JSON = json.dumps({"items": [], "updated_at": None}, indent=2)
+
+# Minimal manifest written by tmp_skill_dir
+_TEST_SKILL_MANIFEST_JSON = json.dumps(
+    {
+        "name": "test_skill",
+        "version": "1.0.0",
+        "description": "A minimal test skill for unit testing purposes",
+        "inputs_schema": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        "outputs_schema": {
+            "type": "object",
+            "properties": {"result": {"type": "string"}},
+            "required": ["result"],
+        },
+        "permissions": {"filesystem": "none", "network": False, "subprocess": False},
+        "dependencies": [],
+    },
+    indent=2,
+)
+
+# text_echo manifest written by mock_skill_dir (matches MockLLM output)
+_TEXT_ECHO_MANIFEST_JSON = json.dumps(
+    {
+        "name": "text_echo",
+        "version": "1.0.0",
+        "description": "Transforms text to different formats including uppercase, lowercase, and title case.",
+        "inputs_schema": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "The input text to transform"},
+                "format": {
+                    "type": "string",
+                    "enum": ["upper", "lower", "title"],
+                    "default": "upper",
+                    "description": "The format to apply",
+                },
+            },
+            "required": ["text"],
+        },
+        "outputs_schema": {"type": "string", "description": "The transformed text"},
+        "permissions": {"filesystem": "none", "network": False, "subprocess": False},
+        "dependencies": [],
+    },
+    indent=2,
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add --run-slow to opt into long-running tests."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="Run tests marked slow"
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register custom markers."""
+    config.addinivalue_line("markers", "slow: long-running test, needs --run-slow")
+    config.addinivalue_line(
+        "markers",
+        "docker: needs the Docker sandbox (select with -m docker, spread with -n auto)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Mark Docker-backed tests and skip slow tests unless --run-slow is given."""
+    run_slow = config.getoption("--run-slow")
+    skip_slow = pytest.mark.skip(reason="Slow test, use --run-slow to run")
+    for item in items:
+        # fixturenames is the transitive closure, so module-level runners count too
+        if _DOCKER_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.docker)
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def sandbox_image() -> str:
+    """Ensure the sandbox image exists, building it once per session if missing.
+
+    Skips every requesting test if the Docker CLI is missing or the build fails.
+    """
+    try:
+        # Only return codes matter, so let the kernel discard the output
+        inspect = subprocess.run(
+            ["docker", "image", "inspect", SANDBOX_IMAGE],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if inspect.returncode != 0:
+            build = subprocess.run(
+                [
+                    "docker", "build", "--quiet",
+                    "-f", "docker/Dockerfile.sandbox", "-t", SANDBOX_IMAGE, ".",
+                ],
+                cwd=REPO_ROOT,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if build.returncode != 0:
+                pytest.skip("Docker not available or sandbox image not built")
+    except FileNotFoundError:
+        pytest.skip("Docker CLI not installed")
+    return SANDBOX_IMAGE
+
 
 @pytest.fixture
 def tmp_skill_dir(tmp_path: Path) -> Path:
@@ -33,24 +150,7 @@ def verify() -> bool:
     (skill_dir / "skill.py").write_text(skill_code)
 
     # Minimal skill.json manifest
-    manifest = {
-        "name": "test_skill",
-        "version": "1.0.0",
-        "description": "A minimal test skill for unit testing purposes",
-        "inputs_schema": {
-            "type": "object",
-            "properties": {"text": {"type": "string"}},
-            "required": ["text"],
-        },
-        "outputs_schema": {
-            "type": "object",
-            "properties": {"result": {"type": "string"}},
-            "required": ["result"],
-        },
-        "permissions": {"filesystem": "none", "network": False, "subprocess": False},
-        "dependencies": [],
-    }
-    (skill_dir / "skill.json").write_text(json.dumps(manifest, indent=2))
+    (skill_dir / "skill.json").write_text(_TEST_SKILL_MANIFEST_JSON)
 
     return skill_dir
 
@@ -60,8 +160,7 @@ def tmp_registry(tmp_path: Path) -> Path:
     """Create a temp registry.json path."""
     registry_path = tmp_path / "registry.json"
     # Initialize with empty registry structure
-    registry_data = {"skills": {}, "updated_at": None}
-    registry_path.write_text(json.dumps(registry_data, indent=2))
+    registry_path.write_text(_EMPTY_REGISTRY_JSON)
     return registry_path
 
 
@@ -70,8 +169,7 @@ def tmp_queue(tmp_path: Path) -> Path:
     """Create a temp nightly_queue.json path."""
     queue_path = tmp_path / "nightly_queue.json"
     # Initialize with empty queue structure
-    queue_data = {"items": [], "updated_at": None}
-    queue_path.write_text(json.dumps(queue_data, indent=2))
+    queue_path.write_text(_EMPTY_QUEUE_JSON)
     return queue_path
 
 
@@ -174,28 +272,7 @@ def verify() -> bool:
     (skill_dir / "skill.py").write_text(skill_code)
 
     # skill.json manifest
-    manifest = {
-        "name": "text_echo",
-        "version": "1.0.0",
-        "description": "Transforms text to different formats including uppercase, lowercase, and title case.",
-        "inputs_schema": {
-            "type": "object",
-            "properties": {
-                "text": {"type": "string", "description": "The input text to transform"},
-                "format": {
-                    "type": "string",
-                    "enum": ["upper", "lower", "title"],
-                    "default": "upper",
-                    "description": "The format to apply",
-                },
-            },
-            "required": ["text"],
-        },
-        "outputs_schema": {"type": "string", "description": "The transformed text"},
-        "permissions": {"filesystem": "none", "network": False, "subprocess": False},
-        "dependencies": [],
-    }
-    (skill_dir / "skill.json").write_text(json.dumps(manifest, indent=2))
+    (skill_dir / "skill.json").write_text(_TEXT_ECHO_MANIFEST_JSON)
 
     return skill_dir
 
@@ -251,8 +328,13 @@ def mock_eval_dir(tmp_path: Path) -> Path:
     return eval_dir
 
 
-@pytest.fixture
-def docker_available() -> bool:
-    """Check if Docker daemon is running and sandbox image exists."""
-    runner = SandboxRunner()
-    return runner.is_available()
+@pytest.fixture(scope="session")
+def sandbox_runner() -> SandboxRunner:
+    """Single SandboxRunner shared by the whole test session."""
+    return SandboxRunner()
+
+
+@pytest.fixture(scope="session")
+def docker_available(sandbox_runner: SandboxRunner) -> bool:
+    """Check once per session if Docker daemon is running and sandbox image exists."""
+    return sandbox_runner.is_available()
@@ -3,14 +3,16 @@
 Test matrix from spec/acceptance.md section 3.1.
 """
 
+import ast
+
 import pytest
 
 from src.security.ast_gate import ASTGate, GateResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gate() -> ASTGate:
-    """Create an ASTGate instance for testing."""
+    """Shared ASTGate instance (check() keeps no state between calls)."""
     return ASTGate()
 
 
@@ -526,6 +528,36 @@ class TestSyntaxErrors:
         assert any("Syntax error" in v for v in result.violations)
 
 
+# =============================================================================
+# PRE-PARSED TREES - check_tree() must match check()
+# =============================================================================
+
+
+class TestCheckTree:
+    """Test checking an already-parsed AST."""
+
+    def test_matches_check(self, gate: ASTGate) -> None:
+        """check_tree() should report the same violations as check()."""
+        code = "import os\nx = eval('1')\ny = ().__class__.__bases__"
+        result = gate.check_tree(ast.parse(code), code)
+        assert result == gate.check(code)
+        assert not result.passed
+
+    def test_string_patterns_still_checked(self, gate: ASTGate) -> None:
+        """Patterns only visible in the source (comments) must still be caught."""
+        code = "# read ../secret\nx = 1"
+        result = gate.check_tree(ast.parse(code), code)
+        assert not result.passed
+        assert any("Suspicious pattern" in v for v in result.violations)
+
+    def test_safe_tree_passes(self, gate: ASTGate) -> None:
+        """Safe code should pass via check_tree()."""
+        code = "import json\ndata = json.dumps({})"
+        result = gate.check_tree(ast.parse(code), code)
+        assert result.passed
+        assert result.violations == []
+
+
 # =============================================================================
 # EDGE CASES
 # =============================================================================
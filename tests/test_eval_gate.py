@@ -1,7 +1,7 @@
 """Tests for the evaluation gate module."""
 
 import json
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -10,21 +10,20 @@ from src.eval.gate import EvalGate, EvalResult, GateReport
 
 
 @pytest.fixture
-def temp_eval_dir():
-    """Create a temporary evaluation data directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        eval_dir = Path(tmpdir)
-        (eval_dir / "replay").mkdir()
-        (eval_dir / "regression").mkdir()
-        (eval_dir / "redteam").mkdir()
-        yield eval_dir
+def temp_eval_dir(tmp_path: Path) -> Path:
+    """Create a temporary evaluation data directory under the test's tmp_path."""
+    eval_dir = tmp_path / "eval"
+    for category in ("replay", "regression", "redteam"):
+        (eval_dir / category).mkdir(parents=True)
+    return eval_dir
 
 
 @pytest.fixture
-def temp_skill_dir():
-    """Create a temporary skill directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_skill_dir(tmp_path: Path) -> Path:
+    """Create a temporary skill directory under the test's tmp_path."""
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    return skill_dir
 
 
 def create_skill(skill_dir: Path, code: str) -> Path:
@@ -488,6 +487,62 @@ def action(text, format):
         assert report.pass_rate == 1.0
 
 
+class TestSkillCompileCache:
+    """Tests for reusing compiled skill code across cases."""
+
+    def test_skill_compiled_once_across_cases(self, temp_eval_dir, temp_skill_dir, monkeypatch):
+        """skill.py is compiled once and reused while unchanged."""
+        create_skill(temp_skill_dir, "def action(text):\n    return text\n")
+        gate = EvalGate(temp_eval_dir)
+        case = {"id": "c1", "input": {"text": "hi"}, "expected": {"type": "exact", "value": "hi"}}
+
+        calls = []
+        real_compile = compile
+        monkeypatch.setattr(
+            "builtins.compile", lambda *a, **k: calls.append(a) or real_compile(*a, **k)
+        )
+        assert gate.run_case(case, temp_skill_dir).passed
+        assert gate.run_case(case, temp_skill_dir).passed
+        assert len(calls) == 1
+
+    def test_modified_skill_is_recompiled(self, temp_eval_dir, temp_skill_dir):
+        """Changing skill.py invalidates the cached code."""
+        create_skill(temp_skill_dir, "def action(text):\n    return text\n")
+        gate = EvalGate(temp_eval_dir)
+        case = {"id": "c1", "input": {"text": "hi"}, "expected": {"type": "exact", "value": "HI"}}
+
+        assert not gate.run_case(case, temp_skill_dir).passed
+        create_skill(temp_skill_dir, "def action(text):\n    return text.upper()  # v2\n")
+        assert gate.run_case(case, temp_skill_dir).passed
+
+    def test_same_size_rewrite_is_recompiled(self, temp_eval_dir, temp_skill_dir):
+        """A same-size rewrite with an unchanged mtime still invalidates the cache."""
+        create_skill(temp_skill_dir, "def action(text):\n    return text.lower()\n")
+        skill_file = temp_skill_dir / "skill.py"
+        stat = skill_file.stat()
+        gate = EvalGate(temp_eval_dir)
+        case = {"id": "c1", "input": {"text": "hi"}, "expected": {"type": "exact", "value": "HI"}}
+
+        assert not gate.run_case(case, temp_skill_dir).passed
+        create_skill(temp_skill_dir, "def action(text):\n    return text.upper()\n")
+        os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert skill_file.stat().st_size == stat.st_size
+        assert skill_file.stat().st_mtime_ns == stat.st_mtime_ns
+        assert gate.run_case(case, temp_skill_dir).passed
+
+    def test_module_state_not_shared_between_cases(self, temp_eval_dir, temp_skill_dir):
+        """Each case runs in a fresh module namespace."""
+        create_skill(
+            temp_skill_dir,
+            "calls = []\n\ndef action():\n    calls.append(1)\n    return len(calls)\n",
+        )
+        gate = EvalGate(temp_eval_dir)
+        case = {"id": "c1", "input": {}, "expected": {"type": "exact", "value": 1}}
+
+        assert gate.run_case(case, temp_skill_dir).passed
+        assert gate.run_case(case, temp_skill_dir).passed
+
+
 class TestEvalResultDataclass:
     """Tests for EvalResult dataclass."""
 
@@ -1,7 +1,10 @@
 """Tests for manifest validator."""
 
+import json
+
 import pytest
 
+from src.validators import manifest as manifest_module
 from src.validators.manifest import validate_manifest
 
 
@@ -216,3 +219,35 @@ class TestAdditionalProperties:
         valid_manifest["permissions"]["unknown"] = True
         is_valid, errors = validate_manifest(valid_manifest)
         assert is_valid is False
+
+
+class TestValidatorCache:
+    """Tests for reuse of the compiled schema validator."""
+
+    @pytest.fixture
+    def tmp_schema(self, tmp_path, monkeypatch):
+        """Point the validator at a minimal schema and reset its cache around the test."""
+        schema_path = tmp_path / "skill_schema.json"
+        schema_path.write_text(json.dumps({"type": "object", "required": ["name"]}))
+        monkeypatch.setattr(manifest_module, "SCHEMA_PATH", schema_path)
+        manifest_module._get_validator.cache_clear()
+        yield schema_path
+        manifest_module._get_validator.cache_clear()
+
+    def test_validator_built_once(self, tmp_schema):
+        """Repeated validations reuse one validator instead of reloading the schema."""
+        assert validate_manifest({"name": "text_echo"}) == (True, [])
+        is_valid, errors = validate_manifest({})
+        assert is_valid is False
+        assert "'name' is a required property" in errors[0]
+        assert manifest_module._get_validator.cache_info().misses == 1
+
+    def test_missing_schema_not_cached(self, tmp_schema):
+        """A missing schema is reported each call and picked up once it appears."""
+        tmp_schema.rename(tmp_schema.with_suffix(".bak"))
+        is_valid, errors = validate_manifest({"name": "text_echo"})
+        assert is_valid is False
+        assert "Schema file not found" in errors[0]
+
+        tmp_schema.with_suffix(".bak").rename(tmp_schema)
+        assert validate_manifest({"name": "text_echo"}) == (True, [])
@@ -8,6 +8,12 @@ from src.security.ast_gate import ASTGate
 from src.validators.manifest import validate_manifest
 
 
+@pytest.fixture(scope="module")
+def gate() -> ASTGate:
+    """Shared ASTGate instance (check() keeps no state between calls)."""
+    return ASTGate()
+
+
 class TestMockLLMInterface:
     """Test MockLLM implements LLMProvider correctly."""
 
@@ -140,10 +146,6 @@ class TestASTGateCompliance:
     def llm(self):
         return MockLLM()
 
-    @pytest.fixture
-    def gate(self):
-        return ASTGate()
-
     def test_text_echo_passes_ast_gate(self, llm, gate):
         """text_echo code should pass AST Gate."""
         pkg = llm.generate_skill("text echo")
@@ -3,7 +3,6 @@
 import json
 import subprocess
 import sys
-import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -15,30 +14,24 @@ from src.registry import Registry
 
 
 @pytest.fixture
-def temp_dirs():
-    """Create temporary directories for staging, prod, eval, and registry."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        staging = base / "staging"
-        prod = base / "prod"
-        eval_dir = base / "eval"
-        registry_path = base / "registry.json"
-        audit_log_path = base / "audit.log"
-
-        staging.mkdir()
-        prod.mkdir()
-        eval_dir.mkdir()
-        (eval_dir / "replay").mkdir()
-        (eval_dir / "regression").mkdir()
-        (eval_dir / "redteam").mkdir()
-
-        yield {
-            "staging": staging,
-            "prod": prod,
-            "eval_dir": eval_dir,
-            "registry_path": registry_path,
-            "audit_log_path": audit_log_path,
-        }
+def temp_dirs(tmp_path: Path) -> dict[str, Path]:
+    """Create staging, prod, eval, and registry paths under pytest's tmp_path."""
+    staging = tmp_path / "staging"
+    prod = tmp_path / "prod"
+    eval_dir = tmp_path / "eval"
+
+    staging.mkdir()
+    prod.mkdir()
+    for category in ("replay", "regression", "redteam"):
+        (eval_dir / category).mkdir(parents=True)
+
+    return {
+        "staging": staging,
+        "prod": prod,
+        "eval_dir": eval_dir,
+        "registry_path": tmp_path / "registry.json",
+        "audit_log_path": tmp_path / "audit.log",
+    }
 
 
 def create_skill_in_staging(staging: Path, name: str, version: str, code: str) -> Path:
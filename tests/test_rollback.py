@@ -1,15 +1,93 @@
 """Tests for rollback functionality."""
 
+import functools
 import json
 import subprocess
 import sys
-from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from src.registry import Registry
-from src.rollback import rollback_skill
+from src.rollback import rollback_skill, rollback_skill_entry
+
+
+# Version tables are shared across tests; they are only ever serialized,
+# never mutated, so no per-call copy is needed.
+_DEFAULT_VERSIONS: dict[str, dict] = {
+    "0.9.0": {
+        "version": "0.9.0",
+        "code_hash": "hash_090",
+        "manifest_hash": "manifest_090",
+        "created_at": "2026-01-01T10:00:00",
+        "status": "disabled",
+        "promoted_at": "2026-01-01T12:00:00",
+        "disabled_at": "2026-01-15T10:00:00",
+        "disabled_reason": "Superseded by 1.0.0",
+    },
+    "1.0.0": {
+        "version": "1.0.0",
+        "code_hash": "hash_100",
+        "manifest_hash": "manifest_100",
+        "created_at": "2026-01-15T10:00:00",
+        "status": "prod",
+        "promoted_at": "2026-01-15T12:00:00",
+    },
+}
+
+# A prod version plus a staging version that was never promoted
+_UNPROMOTED_STAGING_VERSIONS: dict[str, dict] = {
+    "1.0.0": {
+        "version": "1.0.0",
+        "code_hash": "hash_100",
+        "manifest_hash": "manifest_100",
+        "created_at": "2026-01-15T10:00:00",
+        "status": "prod",
+        "promoted_at": "2026-01-15T12:00:00",
+    },
+    "1.1.0": {
+        "version": "1.1.0",
+        "code_hash": "hash_110",
+        "manifest_hash": "manifest_110",
+        "created_at": "2026-01-20T10:00:00",
+        "status": "staging",
+        # No promoted_at - never promoted
+    },
+}
+
+# A single disabled (previously prod) version and no current prod
+_DISABLED_ONLY_VERSIONS: dict[str, dict] = {
+    "0.9.0": {**_DEFAULT_VERSIONS["0.9.0"], "disabled_reason": "Manual disable"},
+}
+
+
+def _registry_data(
+    skill_name: str,
+    versions: dict[str, dict],
+    current_prod: str | None,
+    current_staging: str | None,
+) -> dict:
+    """Build the registry document for a single skill."""
+    return {
+        "skills": {
+            skill_name: {
+                "name": skill_name,
+                "current_prod": current_prod,
+                "current_staging": current_staging,
+                "versions": versions,
+            }
+        },
+        "updated_at": "2026-01-01T00:00:00",  # tests never assert on it
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _default_registry_bytes(
+    skill_name: str, current_prod: str | None, current_staging: str | None
+) -> bytes:
+    """Serialize the default registry once per argument combination."""
+    data = _registry_data(skill_name, _DEFAULT_VERSIONS, current_prod, current_staging)
+    return json.dumps(data, separators=(",", ":")).encode()
 
 
 def create_test_registry(
@@ -20,44 +98,16 @@ def create_test_registry(
     current_staging: str | None = None,
 ) -> None:
     """Helper to create a test registry file."""
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+
     if versions is None:
-        versions = {
-            "0.9.0": {
-                "version": "0.9.0",
-                "code_hash": "hash_090",
-                "manifest_hash": "manifest_090",
-                "created_at": "2026-01-01T10:00:00",
-                "status": "disabled",
-                "promoted_at": "2026-01-01T12:00:00",
-                "disabled_at": "2026-01-15T10:00:00",
-                "disabled_reason": "Superseded by 1.0.0",
-            },
-            "1.0.0": {
-                "version": "1.0.0",
-                "code_hash": "hash_100",
-                "manifest_hash": "manifest_100",
-                "created_at": "2026-01-15T10:00:00",
-                "status": "prod",
-                "promoted_at": "2026-01-15T12:00:00",
-            },
-        }
-        current_prod = current_prod or "1.0.0"
-
-    data = {
-        "skills": {
-            skill_name: {
-                "name": skill_name,
-                "current_prod": current_prod,
-                "current_staging": current_staging,
-                "versions": versions,
-            }
-        },
-        "updated_at": datetime.now().isoformat(),
-    }
+        registry_path.write_bytes(
+            _default_registry_bytes(skill_name, current_prod or "1.0.0", current_staging)
+        )
+        return
 
-    registry_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(registry_path, "w") as f:
-        json.dump(data, f, indent=2)
+    data = _registry_data(skill_name, versions, current_prod, current_staging)
+    registry_path.write_text(json.dumps(data, separators=(",", ":")), newline="")
 
 
 class TestRollbackSkill:
@@ -87,71 +137,48 @@ class TestRollbackSkill:
         assert entry.versions["0.9.0"].status == "prod"
         assert entry.versions["1.0.0"].status == "disabled"
 
-    def test_nonexistent_skill_raises_valueerror(self, tmp_path: Path) -> None:
-        """Test that rollback raises ValueError for nonexistent skill."""
-        registry_path = tmp_path / "registry.json"
-        audit_path = tmp_path / "audit.log"
-
-        create_test_registry(registry_path)
-
-        with pytest.raises(ValueError, match="Skill not found"):
-            rollback_skill(
-                skill_name="nonexistent_skill",
-                target_version="0.9.0",
-                registry_path=registry_path,
-                audit_log_path=audit_path,
-            )
-
-    def test_nonexistent_version_raises_valueerror(self, tmp_path: Path) -> None:
-        """Test that rollback raises ValueError for nonexistent version."""
+    @pytest.mark.parametrize(
+        ("skill_name", "target_version", "versions", "current_staging", "match"),
+        [
+            pytest.param(
+                "nonexistent_skill", "0.9.0", None, None, "Skill not found",
+                id="nonexistent_skill",
+            ),
+            pytest.param(
+                "text_echo", "2.0.0", None, None, "Version not found",
+                id="nonexistent_version",
+            ),
+            pytest.param(
+                "text_echo", "1.1.0", _UNPROMOTED_STAGING_VERSIONS, "1.1.0",
+                "version was never promoted",
+                id="unvalidated_staging",
+            ),
+        ],
+    )
+    def test_rollback_raises_valueerror(
+        self,
+        tmp_path: Path,
+        skill_name: str,
+        target_version: str,
+        versions: dict[str, dict] | None,
+        current_staging: str | None,
+        match: str,
+    ) -> None:
+        """Test that invalid rollback targets raise ValueError."""
         registry_path = tmp_path / "registry.json"
         audit_path = tmp_path / "audit.log"
 
-        create_test_registry(registry_path)
-
-        with pytest.raises(ValueError, match="Version not found"):
-            rollback_skill(
-                skill_name="text_echo",
-                target_version="2.0.0",
-                registry_path=registry_path,
-                audit_log_path=audit_path,
-            )
-
-    def test_cannot_rollback_to_unvalidated_staging(self, tmp_path: Path) -> None:
-        """Test that rollback to never-promoted staging version fails."""
-        registry_path = tmp_path / "registry.json"
-        audit_path = tmp_path / "audit.log"
-
-        # Create registry with a staging version that was never promoted
-        versions = {
-            "1.0.0": {
-                "version": "1.0.0",
-                "code_hash": "hash_100",
-                "manifest_hash": "manifest_100",
-                "created_at": "2026-01-15T10:00:00",
-                "status": "prod",
-                "promoted_at": "2026-01-15T12:00:00",
-            },
-            "1.1.0": {
-                "version": "1.1.0",
-                "code_hash": "hash_110",
-                "manifest_hash": "manifest_110",
-                "created_at": "2026-01-20T10:00:00",
-                "status": "staging",
-                # No promoted_at - never promoted
-            },
-        }
         create_test_registry(
             registry_path,
             versions=versions,
             current_prod="1.0.0",
-            current_staging="1.1.0",
+            current_staging=current_staging,
         )
 
-        with pytest.raises(ValueError, match="version was never promoted"):
+        with pytest.raises(ValueError, match=match):
             rollback_skill(
-                skill_name="text_echo",
-                target_version="1.1.0",
+                skill_name=skill_name,
+                target_version=target_version,
                 registry_path=registry_path,
                 audit_log_path=audit_path,
             )
@@ -163,17 +190,13 @@ class TestRollbackSkill:
 
         create_test_registry(registry_path)
 
-        rollback_skill(
+        entry = rollback_skill_entry(
             skill_name="text_echo",
             target_version="0.9.0",
             registry_path=registry_path,
             audit_log_path=audit_path,
         )
 
-        registry = Registry(registry_path)
-        entry = registry.get_entry("text_echo")
-        assert entry is not None
-
         # Old prod should be disabled
         old_prod = entry.versions["1.0.0"]
         assert old_prod.status == "disabled"
@@ -187,16 +210,13 @@ class TestRollbackSkill:
 
         create_test_registry(registry_path)
 
-        rollback_skill(
+        entry = rollback_skill_entry(
             skill_name="text_echo",
             target_version="0.9.0",
             registry_path=registry_path,
             audit_log_path=audit_path,
         )
 
-        registry = Registry(registry_path)
-        entry = registry.get_entry("text_echo")
-        assert entry is not None
         assert entry.current_prod == "0.9.0"
 
     def test_audit_logged(self, tmp_path: Path) -> None:
@@ -229,36 +249,19 @@ class TestRollbackSkill:
         audit_path = tmp_path / "audit.log"
 
         # Create registry with a disabled version but no current prod
-        versions = {
-            "0.9.0": {
-                "version": "0.9.0",
-                "code_hash": "hash_090",
-                "manifest_hash": "manifest_090",
-                "created_at": "2026-01-01T10:00:00",
-                "status": "disabled",
-                "promoted_at": "2026-01-01T12:00:00",
-                "disabled_at": "2026-01-15T10:00:00",
-                "disabled_reason": "Manual disable",
-            },
-        }
         create_test_registry(
             registry_path,
-            versions=versions,
+            versions=_DISABLED_ONLY_VERSIONS,
             current_prod=None,
         )
 
-        result = rollback_skill(
+        entry = rollback_skill_entry(
             skill_name="text_echo",
             target_version="0.9.0",
             registry_path=registry_path,
             audit_log_path=audit_path,
         )
 
-        assert result is True
-
-        registry = Registry(registry_path)
-        entry = registry.get_entry("text_echo")
-        assert entry is not None
         assert entry.current_prod == "0.9.0"
         assert entry.versions["0.9.0"].status == "prod"
 
@@ -274,18 +277,13 @@ class TestRollbackSkill:
 
         create_test_registry(registry_path, current_prod="1.0.0")
 
-        result = rollback_skill(
+        entry = rollback_skill_entry(
             skill_name="text_echo",
             target_version="1.0.0",
             registry_path=registry_path,
             audit_log_path=audit_path,
         )
 
-        assert result is True
-
-        registry = Registry(registry_path)
-        entry = registry.get_entry("text_echo")
-        assert entry is not None
         assert entry.current_prod == "1.0.0"
         # Should still be prod, not disabled (since target == current)
         assert entry.versions["1.0.0"].status == "prod"
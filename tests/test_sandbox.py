@@ -1,41 +1,41 @@
 """Tests for Docker sandbox harness and runner.
 
-Tests are skipped if Docker is not available.
+Docker-backed tests are skipped if Docker is not available.
 """
+import stat
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 import pytest
+from docker.errors import APIError
+from requests.exceptions import ReadTimeout
 
 from src.sandbox.runner import SandboxRunner
 
+# Skill with a valid action(); the verify() body is filled in per test
+_SKILL_TEMPLATE = """
+def verify():
+    {}
 
-def docker_available() -> bool:
-    """Check if Docker is available for testing."""
-    try:
-        runner = SandboxRunner()
-        return runner.is_available()
-    except Exception:
-        return False
-
+def action(inputs):
+    return {{"result": "ok"}}
+"""
 
-# Skip all tests if Docker is not available
-pytestmark = pytest.mark.skipif(
-    not docker_available(), reason="Docker not available or image not built"
-)
 
+@pytest.fixture(scope="module")
+def runner(sandbox_image: str) -> SandboxRunner:
+    """Create a sandbox runner that starts a fresh container per run, like evolve.
 
-@pytest.fixture
-def runner() -> SandboxRunner:
-    """Create a sandbox runner instance."""
+    Depends on sandbox_image, so tests using it skip when Docker is unavailable.
+    """
     return SandboxRunner(timeout=30)
 
 
 @pytest.fixture
-def skill_dir():
-    """Create a temporary directory for skill files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def skill_dir(tmp_path: Path) -> Path:
+    """Temporary directory for skill files (pytest-managed cleanup)."""
+    return tmp_path
 
 
 def write_skill(skill_dir: Path, code: str) -> Path:
@@ -50,13 +50,7 @@ class TestVerifySuccess:
 
     def test_verify_returns_true(self, runner: SandboxRunner, skill_dir: Path):
         """Skill with verify() returning True should pass."""
-        code = '''
-def verify():
-    return True
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("return True")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -71,13 +65,7 @@ class TestVerifyFalse:
 
     def test_verify_returns_false(self, runner: SandboxRunner, skill_dir: Path):
         """Skill with verify() returning False should fail."""
-        code = '''
-def verify():
-    return False
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("return False")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -91,13 +79,7 @@ class TestVerifyNone:
 
     def test_verify_returns_none(self, runner: SandboxRunner, skill_dir: Path):
         """Skill with verify() returning None should fail (not truthy check)."""
-        code = '''
-def verify():
-    return None
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("return None")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -111,13 +93,7 @@ class TestVerifyTruthyInt:
 
     def test_verify_returns_int_one(self, runner: SandboxRunner, skill_dir: Path):
         """Skill with verify() returning 1 should fail (strict is True check)."""
-        code = '''
-def verify():
-    return 1
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("return 1")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -132,13 +108,7 @@ class TestVerifyTruthyString:
 
     def test_verify_returns_string(self, runner: SandboxRunner, skill_dir: Path):
         """Skill with verify() returning 'yes' should fail (strict is True check)."""
-        code = '''
-def verify():
-    return "yes"
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format('return "yes"')
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -152,13 +122,7 @@ class TestVerifyException:
 
     def test_verify_raises_exception(self, runner: SandboxRunner, skill_dir: Path):
         """Skill with verify() raising exception should fail."""
-        code = '''
-def verify():
-    raise ValueError("Something went wrong")
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format('raise ValueError("Something went wrong")')
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -172,13 +136,7 @@ class TestSystemExitZero:
 
     def test_systemexit_zero_is_caught(self, runner: SandboxRunner, skill_dir: Path):
         """SystemExit(0) should be caught and treated as failure."""
-        code = '''
-def verify():
-    raise SystemExit(0)
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("raise SystemExit(0)")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -192,13 +150,7 @@ class TestSystemExitOne:
 
     def test_systemexit_one_is_caught(self, runner: SandboxRunner, skill_dir: Path):
         """SystemExit(1) should be caught and treated as failure."""
-        code = '''
-def verify():
-    raise SystemExit(1)
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("raise SystemExit(1)")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -212,13 +164,7 @@ class TestKeyboardInterrupt:
 
     def test_keyboard_interrupt_is_caught(self, runner: SandboxRunner, skill_dir: Path):
         """KeyboardInterrupt should be caught and treated as failure."""
-        code = '''
-def verify():
-    raise KeyboardInterrupt()
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("raise KeyboardInterrupt()")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -230,18 +176,28 @@ def action(inputs):
 class TestTimeout:
     """Test cases for timeout handling."""
 
-    def test_infinite_loop_times_out(self, skill_dir: Path):
+    def test_wait_timeout_is_reported(self, skill_dir: Path):
+        """A timed-out container wait should fail the run and flag the timeout."""
+        runner = SandboxRunner(timeout=5)
+        container = mock.MagicMock()
+        container.wait.side_effect = ReadTimeout("timed out")
+        container.logs.return_value = b""
+        runner._client = mock.MagicMock()
+        runner._client.containers.run.return_value = container
+
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        passed, logs, metrics = runner.run(skill_dir)
+
+        assert passed is False
+        assert metrics["timeout"] is True
+        assert metrics["exit_code"] == -1
+        container.remove.assert_called_once_with(force=True)
+
+    @pytest.mark.slow
+    def test_infinite_loop_times_out(self, sandbox_image: str, skill_dir: Path):
         """Skill with infinite loop should timeout."""
         runner = SandboxRunner(timeout=5)  # Short timeout for test
-        code = '''
-def verify():
-    while True:
-        pass
-    return True
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("while True:\n        pass\n    return True")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -294,19 +250,247 @@ class TestRunnerAvailability:
         # If we got this far, Docker is available
         assert result is True
 
+    def test_is_available_is_cached(self):
+        """is_available() should probe Docker once unless refresh=True."""
+        runner = SandboxRunner()
+        with mock.patch.object(SandboxRunner, "_probe", return_value=False) as probe:
+            assert runner.is_available() is False
+            assert runner.is_available() is False
+            assert probe.call_count == 1
+
+            runner.is_available(refresh=True)
+            assert probe.call_count == 2
+
+
+class TestRunnerConfig:
+    """Test runner configuration validation."""
+
+    @pytest.mark.parametrize("timeout", [0, -5])
+    def test_non_positive_timeout_rejected(self, timeout: int):
+        """A non-positive timeout should raise before any Docker access."""
+        with mock.patch("src.sandbox.runner.docker.from_env") as from_env:
+            with pytest.raises(ValueError, match="timeout must be positive"):
+                SandboxRunner(timeout=timeout)
+        from_env.assert_not_called()
+
+
+@pytest.fixture
+def exec_runner(tmp_path: Path):
+    """Reuse-mode runner on a mocked Docker client (no daemon needed).
+
+    The exec API returns a passing harness run by default; tests override
+    exec_start/exec_inspect return values or side effects as needed.
+    """
+    runner = SandboxRunner(timeout=5, reuse_container=True)
+    runner._client = mock.MagicMock()
+    runner._client.containers.run.return_value.id = "cid"
+    api = runner._client.api
+    api.exec_create.return_value = {"Id": "eid"}
+    api.exec_start.return_value = b"VERIFICATION_SUCCESS"
+    api.exec_inspect.return_value = {"ExitCode": 0}
+    yield runner
+    runner.close()
+
+
+class TestExecMode:
+    """Unit tests for reuse_container=True runs against a mocked Docker API."""
+
+    def test_mounted_tree_readable_by_others(self, exec_runner: SandboxRunner, skill_dir: Path):
+        """The container user (any UID) must be able to read the copied skill."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        skill_dir.chmod(0o700)
+        (skill_dir / "skill.py").chmod(0o600)
+
+        modes: dict[str, int] = {}
+
+        def record_modes(container_id, cmd, **kwargs):
+            workdir = exec_runner._workdir
+            for path in [workdir, *workdir.rglob("*")]:
+                modes[str(path.relative_to(workdir))] = path.stat().st_mode
+            return {"Id": "eid"}
+
+        exec_runner._client.api.exec_create.side_effect = record_modes
+        passed, _, _ = exec_runner.run(skill_dir)
+
+        assert passed is True
+        assert any(name.endswith("skill.py") for name in modes)
+        for name, mode in modes.items():
+            needed = stat.S_IROTH | (stat.S_IXOTH if stat.S_ISDIR(mode) else 0)
+            assert mode & needed == needed, f"{name} not readable by others: {oct(mode)}"
+        # Source permissions are left untouched
+        assert stat.S_IMODE((skill_dir / "skill.py").stat().st_mode) == 0o600
+
+    def test_container_reset_before_each_run(self, exec_runner: SandboxRunner, skill_dir: Path):
+        """Leftover processes and /tmp are cleared before every harness exec."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        exec_runner.run(skill_dir)
+        exec_runner.run(skill_dir)
+
+        calls = exec_runner._client.api.exec_create.call_args_list
+        commands = [c.args[1] for c in calls]
+        assert len(commands) == 4
+        # Execs never run as the user owning the keep-alive process
+        assert all(c.kwargs["user"] == "nobody" for c in calls)
+        for reset, harness in zip(commands[::2], commands[1::2]):
+            assert reset[:2] == ["sh", "-c"]
+            assert "kill -9 -1" in reset[2] and "/tmp/*" in reset[2]
+            assert "/sandbox/harness.py" in harness
+
+    def test_shared_container_runs_under_init(self, exec_runner: SandboxRunner, skill_dir: Path):
+        """The shared container needs an init to reap processes the reset kills."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        exec_runner.run(skill_dir)
+
+        assert exec_runner._client.containers.run.call_args.kwargs["init"] is True
+
+    def test_workdir_removed_when_start_fails(
+        self, exec_runner: SandboxRunner, skill_dir: Path, monkeypatch
+    ):
+        """A failed container start must not leak the mkdtemp work dir."""
+        workdirs: list[Path] = []
+        real_mkdtemp = tempfile.mkdtemp
+
+        def recording_mkdtemp(*args, **kwargs):
+            workdirs.append(Path(real_mkdtemp(*args, **kwargs)))
+            return str(workdirs[-1])
+
+        monkeypatch.setattr(tempfile, "mkdtemp", recording_mkdtemp)
+        exec_runner._client.containers.run.side_effect = APIError("boom")
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+
+        passed, _, metrics = exec_runner.run(skill_dir)
+
+        assert passed is False
+        assert metrics["error"] == "api_error"
+        assert len(workdirs) == 1 and not workdirs[0].exists()
+        assert exec_runner._workdir is None
+
+    def test_symlinks_not_followed(
+        self, exec_runner: SandboxRunner, skill_dir: Path, tmp_path_factory
+    ):
+        """A link to a private host file is mounted as a link, never as its contents."""
+        secret = tmp_path_factory.mktemp("host") / "secret.txt"
+        secret.write_text("host secret")
+        secret.chmod(0o600)
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        (skill_dir / "leak.txt").symlink_to(secret)
+
+        is_link: list[bool] = []
+
+        def record_link(container_id, cmd, **kwargs):
+            is_link.extend(p.is_symlink() for p in exec_runner._workdir.rglob("leak.txt"))
+            return {"Id": "eid"}
+
+        exec_runner._client.api.exec_create.side_effect = record_link
+        passed, _, _ = exec_runner.run(skill_dir)
+
+        assert passed is True
+        assert is_link and all(is_link)
+        assert stat.S_IMODE(secret.stat().st_mode) == 0o600
+
+    def test_host_read_timeout_reported_as_timeout(
+        self, exec_runner: SandboxRunner, skill_dir: Path
+    ):
+        """A client-side ReadTimeout on exec_start is a timeout, not a runner error."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        exec_runner._client.api.exec_start.side_effect = [b"", ReadTimeout("timed out")]
+
+        passed, logs, metrics = exec_runner.run(skill_dir)
+
+        assert passed is False
+        assert metrics["timeout"] is True
+        assert metrics["exit_code"] == -1
+        assert "error" not in metrics
+
+    def test_client_timeout_outlasts_sandbox_timeout(self):
+        """The Docker HTTP timeout must exceed the run timeout so exec_start can return."""
+        with mock.patch("src.sandbox.runner.docker.from_env") as from_env:
+            SandboxRunner(timeout=120).client
+        timeout = from_env.call_args.kwargs["timeout"]
+        assert timeout > 120
+
+    @pytest.mark.parametrize(
+        ("exec_exit", "exit_code", "timeout"),
+        [
+            pytest.param(124, -1, True, id="timeout"),
+            pytest.param(137, 137, False, id="sigkill_oom"),
+            pytest.param(1, 1, False, id="failure"),
+        ],
+    )
+    def test_exit_code_mapping(
+        self,
+        exec_runner: SandboxRunner,
+        skill_dir: Path,
+        exec_exit: int,
+        exit_code: int,
+        timeout: bool,
+    ):
+        """Only `timeout`'s 124 counts as a timeout, reported like a timed-out wait."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        exec_runner._client.api.exec_inspect.return_value = {"ExitCode": exec_exit}
+
+        passed, _, metrics = exec_runner.run(skill_dir)
+
+        assert passed is False
+        assert metrics["exit_code"] == exit_code
+        assert metrics.get("timeout", False) is timeout
+
+    @pytest.mark.parametrize("fail", [False, True], ids=["success", "api_error"])
+    def test_run_dir_removed(self, exec_runner: SandboxRunner, skill_dir: Path, fail: bool):
+        """Each run's copy is removed from the work dir, even when the exec fails."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        if fail:
+            exec_runner._client.api.exec_inspect.side_effect = APIError("boom")
+
+        passed, _, _ = exec_runner.run(skill_dir)
+
+        assert passed is not fail
+        assert exec_runner._workdir is not None
+        assert list(exec_runner._workdir.iterdir()) == []
+
+    def test_output_path_uses_fresh_container(
+        self, exec_runner: SandboxRunner, skill_dir: Path, tmp_path: Path
+    ):
+        """The shared container has no /output mount, so output_path runs fresh."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        client = exec_runner._client
+        container = client.containers.run.return_value
+        container.wait.return_value = {"StatusCode": 0}
+        container.logs.return_value = b"VERIFICATION_SUCCESS"
+
+        passed, _, _ = exec_runner.run(skill_dir, output_path=tmp_path / "out")
+
+        assert passed is True
+        client.api.exec_create.assert_not_called()
+        volumes = client.containers.run.call_args.kwargs["volumes"]
+        assert {"bind": "/output", "mode": "rw"} in volumes.values()
+        container.remove.assert_called_once_with(force=True)
+
+    def test_close_removes_container_and_workdir(
+        self, exec_runner: SandboxRunner, skill_dir: Path
+    ):
+        """close() removes the long-lived container and its work dir, and is idempotent."""
+        write_skill(skill_dir, _SKILL_TEMPLATE.format("return True"))
+        exec_runner.run(skill_dir)
+        container = exec_runner._container
+        workdir = exec_runner._workdir
+        assert workdir is not None and workdir.exists()
+
+        exec_runner.close()
+        exec_runner.close()
+
+        container.remove.assert_called_once_with(force=True)
+        assert not workdir.exists()
+        assert exec_runner._container is None
+        assert exec_runner._workdir is None
+
 
 class TestMetrics:
     """Test that metrics are properly recorded."""
 
     def test_metrics_include_duration(self, runner: SandboxRunner, skill_dir: Path):
         """Metrics should include duration_ms."""
-        code = '''
-def verify():
-    return True
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("return True")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -316,13 +500,7 @@ def action(inputs):
 
     def test_metrics_include_exit_code(self, runner: SandboxRunner, skill_dir: Path):
         """Metrics should include exit_code."""
-        code = '''
-def verify():
-    return True
-
-def action(inputs):
-    return {"result": "ok"}
-'''
+        code = _SKILL_TEMPLATE.format("return True")
         write_skill(skill_dir, code)
         passed, logs, metrics = runner.run(skill_dir)
 
@@ -6,57 +6,128 @@ Tests the full security pipeline:
 3. Combined flow from code check to sandbox verification
 """
 
+import ast
+import re
 from pathlib import Path
 
 import pytest
 
 from src.sandbox.runner import SandboxRunner
-from src.security.ast_gate import ASTGate
+from src.security.ast_gate import ASTGate, GateResult
+
+
+@pytest.fixture(scope="module")
+def gate() -> ASTGate:
+    """Shared ASTGate instance (check() keeps no state between calls)."""
+    return ASTGate()
+
+
+# Tokens TestMultipleViolations expects, matched in one scan of the violation text
+_MULTI_VIOLATION_TOKENS = re.compile(r"\b(os|subprocess|eval|exec)\b")
+
+# Parsed trees keyed by source, so each snippet is parsed at most once
+_parse_cache: dict[str, ast.Module] = {}
+
+
+def _check(gate: ASTGate, code: str) -> GateResult:
+    """Run the gate on code, reusing a cached parse tree when available."""
+    tree = _parse_cache.get(code)
+    if tree is None:
+        tree = _parse_cache[code] = ast.parse(code)
+    return gate.check_tree(tree, code)
+
+
+def _vtext(result: GateResult) -> str:
+    """Join violations into one string for substring assertions."""
+    return " ".join(result.violations)
 
 
 class TestASTGateBypass:
     """Test that AST Gate blocks common bypass attempts."""
 
-    def setup_method(self) -> None:
-        """Initialize AST Gate for each test."""
-        self.gate = ASTGate()
-
-    def test_import_bypass_blocked(self) -> None:
-        """__import__('os') should be rejected by AST gate."""
-        code = '''
+    # name -> (source, token expected in the joined violations)
+    EXPECTED_VIOLATIONS: dict[str, tuple[str, str]] = {
+        # __import__('os')
+        "import": (
+            '''
 def action():
     os_module = __import__('os')
     return os_module.getcwd()
-'''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("__import__" in v for v in result.violations)
-
-    def test_getattr_bypass_blocked(self) -> None:
-        """getattr(x, '__import__') should be rejected by AST gate."""
-        code = '''
+''',
+            "__import__",
+        ),
+        # getattr(x, 'eval')
+        "getattr": (
+            '''
 def action():
-    # Try to bypass via getattr
     builtins = getattr(__builtins__, 'eval')
     return builtins('1+1')
-'''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("getattr" in v for v in result.violations)
-
-    def test_globals_bypass_blocked(self) -> None:
-        """globals()['__builtins__'] should be rejected by AST gate."""
-        code = '''
+''',
+            "getattr",
+        ),
+        # globals()['__builtins__']
+        "globals": (
+            '''
 def action():
-    # Try to access builtins via globals
     g = globals()
     return g['__builtins__']['eval']('1+1')
-'''
-        result = self.gate.check(code)
+''',
+            "globals",
+        ),
+        "eval": (
+            '''
+def action(expr: str):
+    return eval(expr)
+''',
+            "eval",
+        ),
+        "exec": (
+            '''
+def action(code: str):
+    exec(code)
+''',
+            "exec",
+        ),
+        "compile": (
+            '''
+def action(code: str):
+    return compile(code, '<string>', 'exec')
+''',
+            "compile",
+        ),
+        "open": (
+            '''
+def action(path: str):
+    with open(path) as f:
+        return f.read()
+''',
+            "open",
+        ),
+        # Path traversal string
+        "path_traversal": (
+            '''
+def action():
+    path = "../etc/passwd"
+    return path
+''',
+            "Suspicious pattern",
+        ),
+    }
+
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            pytest.param(code, expected, id=name)
+            for name, (code, expected) in EXPECTED_VIOLATIONS.items()
+        ],
+    )
+    def test_bypass_blocked(self, gate: ASTGate, code: str, expected: str) -> None:
+        """Each bypass sample is rejected with its expected violation."""
+        result = _check(gate, code)
         assert not result.passed
-        assert any("globals" in v for v in result.violations)
+        assert expected in _vtext(result)
 
-    def test_subclasses_bypass_blocked(self) -> None:
+    def test_subclasses_bypass_blocked(self, gate: ASTGate) -> None:
         """__subclasses__() should be rejected by AST gate."""
         code = '''
 def action():
@@ -65,32 +136,32 @@ def action():
         if cls.__name__ == 'Popen':
             return cls(['id'])
 '''
-        result = self.gate.check(code)
+        result = _check(gate, code)
         assert not result.passed
         # Should catch __subclasses__ attribute access
-        assert any("__subclasses__" in v for v in result.violations)
+        assert "__subclasses__" in _vtext(result)
 
-    def test_bases_bypass_blocked(self) -> None:
+    def test_bases_bypass_blocked(self, gate: ASTGate) -> None:
         """__bases__ access should be rejected by AST gate."""
         code = '''
 def action():
     return ().__class__.__bases__[0]
 '''
-        result = self.gate.check(code)
+        result = _check(gate, code)
         assert not result.passed
-        assert any("__bases__" in v for v in result.violations)
+        assert "__bases__" in _vtext(result)
 
-    def test_mro_bypass_blocked(self) -> None:
+    def test_mro_bypass_blocked(self, gate: ASTGate) -> None:
         """__mro__ access should be rejected by AST gate."""
         code = '''
 def action():
     return str.__mro__
 '''
-        result = self.gate.check(code)
+        result = _check(gate, code)
         assert not result.passed
-        assert any("__mro__" in v for v in result.violations)
+        assert "__mro__" in _vtext(result)
 
-    def test_code_object_bypass_blocked(self) -> None:
+    def test_code_object_bypass_blocked(self, gate: ASTGate) -> None:
         """__code__ access should be rejected by AST gate."""
         code = '''
 def action():
@@ -98,11 +169,11 @@ def action():
         pass
     return inner.__code__
 '''
-        result = self.gate.check(code)
+        result = _check(gate, code)
         assert not result.passed
-        assert any("__code__" in v for v in result.violations)
+        assert "__code__" in _vtext(result)
 
-    def test_globals_attribute_bypass_blocked(self) -> None:
+    def test_globals_attribute_bypass_blocked(self, gate: ASTGate) -> None:
         """func.__globals__ access should be rejected by AST gate."""
         code = '''
 def action():
@@ -110,11 +181,11 @@ def action():
         pass
     return inner.__globals__['__builtins__']
 '''
-        result = self.gate.check(code)
+        result = _check(gate, code)
         assert not result.passed
-        assert any("__globals__" in v for v in result.violations)
+        assert "__globals__" in _vtext(result)
 
-    def test_closure_bypass_blocked(self) -> None:
+    def test_closure_bypass_blocked(self, gate: ASTGate) -> None:
         """func.__closure__ access should be rejected by AST gate."""
         code = '''
 def action():
@@ -123,85 +194,16 @@ def action():
         return x
     return inner.__closure__
 '''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("__closure__" in v for v in result.violations)
-
-    def test_eval_blocked(self) -> None:
-        """eval() should be rejected by AST gate."""
-        code = '''
-def action(expr: str):
-    return eval(expr)
-'''
-        result = self.gate.check(code)
+        result = _check(gate, code)
         assert not result.passed
-        assert any("eval" in v for v in result.violations)
+        assert "__closure__" in _vtext(result)
 
-    def test_exec_blocked(self) -> None:
-        """exec() should be rejected by AST gate."""
-        code = '''
-def action(code: str):
-    exec(code)
-'''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("exec" in v for v in result.violations)
 
-    def test_compile_blocked(self) -> None:
-        """compile() should be rejected by AST gate."""
-        code = '''
-def action(code: str):
-    return compile(code, '<string>', 'exec')
-'''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("compile" in v for v in result.violations)
-
-    def test_open_blocked(self) -> None:
-        """open() should be rejected by AST gate."""
-        code = '''
-def action(path: str):
-    with open(path) as f:
-        return f.read()
-'''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("open" in v for v in result.violations)
-
-    def test_path_traversal_blocked(self) -> None:
-        """Path traversal patterns should be rejected by AST gate."""
-        code = '''
-def action():
-    path = "../etc/passwd"
-    return path
-'''
-        result = self.gate.check(code)
-        assert not result.passed
-        assert any("Suspicious pattern" in v for v in result.violations)
-
-
-class TestSandboxBypass:
-    """Test that Sandbox catches runtime bypass attempts when Docker is available."""
-
-    def setup_method(self) -> None:
-        """Initialize sandbox runner for each test."""
-        self.runner = SandboxRunner()
-
-    @pytest.fixture
-    def sandbox_available(self) -> bool:
-        """Check if Docker sandbox is available."""
-        return self.runner.is_available()
-
-    def test_systemexit_blocked(self, tmp_path: Path, docker_available: bool) -> None:
-        """Code with `raise SystemExit(0)` should be caught by sandbox BaseException handler."""
-        if not docker_available:
-            pytest.skip("Docker sandbox not available")
-
-        skill_dir = tmp_path / "systemexit_skill"
-        skill_dir.mkdir()
-
-        # Skill that tries to bypass with SystemExit(0)
-        skill_code = '''"""Skill attempting SystemExit bypass."""
+# Runtime bypass attempts: name -> (skill.py source, acceptable log markers)
+_BYPASS_SKILLS: dict[str, tuple[str, tuple[str, ...]]] = {
+    # SystemExit(0) must be caught by the harness BaseException handler
+    "systemexit": (
+        '''"""Skill attempting SystemExit bypass."""
 
 def action(text: str) -> str:
     return text.upper()
@@ -209,51 +211,24 @@ def action(text: str) -> str:
 def verify() -> bool:
     # Try to exit with success code to bypass verification
     raise SystemExit(0)
-'''
-        (skill_dir / "skill.py").write_text(skill_code)
-
-        passed, logs, metrics = self.runner.run(skill_dir)
-
-        # Should fail because SystemExit is caught by BaseException handler
-        assert not passed
-        assert "SystemExit" in logs or "VERIFICATION_FAILED" in logs
-
-    def test_keyboard_interrupt_blocked(
-        self, tmp_path: Path, docker_available: bool
-    ) -> None:
-        """KeyboardInterrupt should be caught by sandbox BaseException handler."""
-        if not docker_available:
-            pytest.skip("Docker sandbox not available")
-
-        skill_dir = tmp_path / "keyboard_interrupt_skill"
-        skill_dir.mkdir()
-
-        skill_code = '''"""Skill attempting KeyboardInterrupt bypass."""
+''',
+        ("SystemExit", "VERIFICATION_FAILED"),
+    ),
+    # KeyboardInterrupt must be caught by the harness BaseException handler
+    "keyboard_interrupt": (
+        '''"""Skill attempting KeyboardInterrupt bypass."""
 
 def action(text: str) -> str:
     return text.upper()
 
 def verify() -> bool:
     raise KeyboardInterrupt()
-'''
-        (skill_dir / "skill.py").write_text(skill_code)
-
-        passed, logs, metrics = self.runner.run(skill_dir)
-
-        assert not passed
-        assert "KeyboardInterrupt" in logs or "VERIFICATION_FAILED" in logs
-
-    def test_truthy_not_true_blocked(
-        self, tmp_path: Path, docker_available: bool
-    ) -> None:
-        """verify() returning 1 (truthy but not True) should fail."""
-        if not docker_available:
-            pytest.skip("Docker sandbox not available")
-
-        skill_dir = tmp_path / "truthy_skill"
-        skill_dir.mkdir()
-
-        skill_code = '''"""Skill returning truthy value instead of True."""
+''',
+        ("KeyboardInterrupt", "VERIFICATION_FAILED"),
+    ),
+    # verify() returning 1 (truthy but not True) must fail
+    "truthy_not_true": (
+        '''"""Skill returning truthy value instead of True."""
 
 def action(text: str) -> str:
     return text.upper()
@@ -261,25 +236,63 @@ def action(text: str) -> str:
 def verify() -> bool:
     # Return 1 which is truthy but not True
     return 1
-'''
-        (skill_dir / "skill.py").write_text(skill_code)
+''',
+        ("VERIFICATION_FAILED",),
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def bypass_results(
+    tmp_path_factory: pytest.TempPathFactory,
+    sandbox_runner: SandboxRunner,
+    docker_available: bool,
+) -> dict[str, tuple[bool, str]]:
+    """Run every bypass skill once, one after another, and cache (passed, logs).
+
+    Runs are sequential: a reuse-mode runner kills every earlier exec before
+    each run, so concurrent runs on one runner could kill each other.
+    """
+    if not docker_available:
+        pytest.skip("Docker sandbox not available")
+
+    base = tmp_path_factory.mktemp("bypass")
+    results: dict[str, tuple[bool, str]] = {}
+    for name, (code, _) in _BYPASS_SKILLS.items():
+        skill_dir = base / f"{name}_skill"
+        skill_dir.mkdir()
+        (skill_dir / "skill.py").write_text(code)
+        passed, logs, _ = sandbox_runner.run(skill_dir)
+        results[name] = (passed, logs)
+    return results
+
+
+class TestSandboxBypass:
+    """Test that Sandbox catches runtime bypass attempts when Docker is available."""
 
-        passed, logs, metrics = self.runner.run(skill_dir)
+    @pytest.mark.parametrize("name", list(_BYPASS_SKILLS))
+    def test_bypass_blocked(
+        self, name: str, bypass_results: dict[str, tuple[bool, str]]
+    ) -> None:
+        """Each bypass attempt should fail verification in the sandbox."""
+        passed, logs = bypass_results[name]
+        _, markers = _BYPASS_SKILLS[name]
 
-        # Should fail because result is not exactly True
         assert not passed
-        assert "VERIFICATION_FAILED" in logs
+        assert any(marker in logs for marker in markers)
 
 
 class TestASTThenSandboxFlow:
     """Test the combined flow: AST Gate check followed by Sandbox verification."""
 
     def test_safe_skill_passes_both(
-        self, tmp_path: Path, docker_available: bool
+        self,
+        tmp_path: Path,
+        gate: ASTGate,
+        sandbox_runner: SandboxRunner,
+        docker_available: bool,
     ) -> None:
         """A safe skill should pass AST Gate and (if Docker available) Sandbox."""
-        gate = ASTGate()
-        runner = SandboxRunner()
 
         # Safe skill code using only allowed imports
         skill_code = '''"""Safe text transformation skill."""
@@ -314,13 +327,12 @@ def verify() -> bool:
             skill_dir.mkdir()
             (skill_dir / "skill.py").write_text(skill_code)
 
-            passed, logs, metrics = runner.run(skill_dir)
+            passed, logs, metrics = sandbox_runner.run(skill_dir)
             assert passed, f"Sandbox failed: {logs}"
             assert "VERIFICATION_SUCCESS" in logs
 
-    def test_unsafe_skill_blocked_at_ast_gate(self) -> None:
+    def test_unsafe_skill_blocked_at_ast_gate(self, gate: ASTGate) -> None:
         """An unsafe skill should be blocked at AST Gate before reaching Sandbox."""
-        gate = ASTGate()
 
         # Unsafe skill code trying to import os
         skill_code = '''"""Unsafe skill attempting to import os."""
@@ -337,11 +349,10 @@ def verify() -> bool:
         # Should fail at AST Gate
         gate_result = gate.check(skill_code)
         assert not gate_result.passed
-        assert any("os" in v for v in gate_result.violations)
+        assert "os" in _vtext(gate_result)
 
-    def test_chained_bypass_attempt_blocked(self) -> None:
+    def test_chained_bypass_attempt_blocked(self, gate: ASTGate) -> None:
         """Complex chained bypass attempts should be blocked."""
-        gate = ASTGate()
 
         # Attempt to chain multiple techniques
         skill_code = '''"""Skill attempting chained bypass."""
@@ -362,16 +373,15 @@ def verify() -> bool:
         gate_result = gate.check(skill_code)
         assert not gate_result.passed
         # Should catch both __bases__ and __subclasses__
-        assert any("__bases__" in v for v in gate_result.violations)
-        assert any("__subclasses__" in v for v in gate_result.violations)
+        assert "__bases__" in _vtext(gate_result)
+        assert "__subclasses__" in _vtext(gate_result)
 
 
 class TestMultipleViolations:
     """Test that multiple violations are all reported."""
 
-    def test_reports_all_violations(self) -> None:
+    def test_reports_all_violations(self, gate: ASTGate) -> None:
         """AST Gate should report all violations, not just the first one."""
-        gate = ASTGate()
 
         # Code with multiple violations
         code = '''
@@ -391,8 +401,5 @@ def action():
         assert len(result.violations) >= 4
 
         # Check specific violations are present
-        violation_text = " ".join(result.violations)
-        assert "os" in violation_text
-        assert "subprocess" in violation_text
-        assert "eval" in violation_text
-        assert "exec" in violation_text
+        matches = set(_MULTI_VIOLATION_TOKENS.findall(_vtext(result)))
+        assert matches == {"os", "subprocess", "eval", "exec"}
@@ -1,5 +1,7 @@
 """Tests for skill model validation."""
 
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
 
@@ -28,21 +30,28 @@ class TestPermission:
             Permission(filesystem="read_all")
 
 
+# Read-only base manifest; tests that need a variant build a copy with {**base, ...}
+_BASE_MANIFEST = MappingProxyType(
+    {
+        "name": "text_echo",
+        "version": "1.0.0",
+        "description": "Echoes the input text back to the user",
+        "inputs_schema": {"type": "object", "properties": {"text": {"type": "string"}}},
+        "outputs_schema": {"type": "string"},
+        "permissions": {"filesystem": "none", "network": False, "subprocess": False},
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def valid_manifest_data():
+    """Return valid manifest data (read-only)."""
+    return _BASE_MANIFEST
+
+
 class TestSkillManifest:
     """Tests for SkillManifest model."""
 
-    @pytest.fixture
-    def valid_manifest_data(self):
-        """Return valid manifest data."""
-        return {
-            "name": "text_echo",
-            "version": "1.0.0",
-            "description": "Echoes the input text back to the user",
-            "inputs_schema": {"type": "object", "properties": {"text": {"type": "string"}}},
-            "outputs_schema": {"type": "string"},
-            "permissions": {"filesystem": "none", "network": False, "subprocess": False},
-        }
-
     def test_valid_manifest(self, valid_manifest_data):
         """Valid manifest passes validation."""
         manifest = SkillManifest(**valid_manifest_data)
@@ -50,92 +59,50 @@ class TestSkillManifest:
         assert manifest.version == "1.0.0"
         assert manifest.author == "auto-generated"
 
-    def test_invalid_name_starts_with_number(self, valid_manifest_data):
-        """Name starting with number is invalid."""
-        valid_manifest_data["name"] = "1text_echo"
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "name" in str(exc.value)
-
-    def test_invalid_name_too_short(self, valid_manifest_data):
-        """Name too short (less than 3 chars) is invalid."""
-        valid_manifest_data["name"] = "ab"
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "name" in str(exc.value)
-
-    def test_invalid_name_too_long(self, valid_manifest_data):
-        """Name too long (more than 64 chars) is invalid."""
-        valid_manifest_data["name"] = "a" * 65
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "name" in str(exc.value)
-
-    def test_invalid_name_uppercase(self, valid_manifest_data):
-        """Name with uppercase is invalid."""
-        valid_manifest_data["name"] = "TextEcho"
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param("name", "1text_echo", id="name_starts_with_number"),
+            pytest.param("name", "ab", id="name_too_short"),
+            pytest.param("name", "a" * 65, id="name_too_long"),
+            pytest.param("name", "TextEcho", id="name_uppercase"),
+            pytest.param("name", "text-echo", id="name_with_dash"),
+            pytest.param("version", "1.0", id="version_format"),
+            pytest.param("version", "v1.0.0", id="version_with_v_prefix"),
+            pytest.param("description", "Too short", id="description_too_short"),
+            pytest.param("description", "x" * 501, id="description_too_long"),
+        ],
+    )
+    def test_invalid_field_rejected(self, valid_manifest_data, field, value):
+        """Invalid name, version, or description values fail validation."""
+        data = {**valid_manifest_data, field: value}
         with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "name" in str(exc.value)
-
-    def test_invalid_name_with_dash(self, valid_manifest_data):
-        """Name with dash is invalid (only underscores allowed)."""
-        valid_manifest_data["name"] = "text-echo"
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "name" in str(exc.value)
+            SkillManifest(**data)
+        assert field in str(exc.value)
 
     def test_valid_name_with_underscore(self, valid_manifest_data):
         """Name with underscore is valid."""
-        valid_manifest_data["name"] = "text_echo_v2"
-        manifest = SkillManifest(**valid_manifest_data)
+        data = {**valid_manifest_data, "name": "text_echo_v2"}
+        manifest = SkillManifest(**data)
         assert manifest.name == "text_echo_v2"
 
     def test_valid_name_with_numbers(self, valid_manifest_data):
         """Name with numbers (not at start) is valid."""
-        valid_manifest_data["name"] = "echo123"
-        manifest = SkillManifest(**valid_manifest_data)
+        data = {**valid_manifest_data, "name": "echo123"}
+        manifest = SkillManifest(**data)
         assert manifest.name == "echo123"
 
-    def test_invalid_version_format(self, valid_manifest_data):
-        """Invalid version format is rejected."""
-        valid_manifest_data["version"] = "1.0"
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "version" in str(exc.value)
-
-    def test_invalid_version_with_v_prefix(self, valid_manifest_data):
-        """Version with v prefix is invalid."""
-        valid_manifest_data["version"] = "v1.0.0"
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "version" in str(exc.value)
-
     def test_valid_version_large_numbers(self, valid_manifest_data):
         """Version with large numbers is valid."""
-        valid_manifest_data["version"] = "123.456.789"
-        manifest = SkillManifest(**valid_manifest_data)
+        data = {**valid_manifest_data, "version": "123.456.789"}
+        manifest = SkillManifest(**data)
         assert manifest.version == "123.456.789"
 
-    def test_description_too_short(self, valid_manifest_data):
-        """Description shorter than 10 chars is invalid."""
-        valid_manifest_data["description"] = "Too short"
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "description" in str(exc.value)
-
-    def test_description_too_long(self, valid_manifest_data):
-        """Description longer than 500 chars is invalid."""
-        valid_manifest_data["description"] = "x" * 501
-        with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
-        assert "description" in str(exc.value)
-
     def test_missing_required_field(self, valid_manifest_data):
         """Missing required field raises error."""
-        del valid_manifest_data["name"]
+        data = {k: v for k, v in valid_manifest_data.items() if k != "name"}
         with pytest.raises(ValidationError) as exc:
-            SkillManifest(**valid_manifest_data)
+            SkillManifest(**data)
         assert "name" in str(exc.value)
 
 